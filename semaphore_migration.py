@@ -1,12 +1,233 @@
 #!/usr/bin/env python3
+import hashlib
 import sqlite3
 import json
 import os
-import glob
 import re
+import sys
+from collections import defaultdict, deque
+from itertools import groupby, islice
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# Use orjson for JSON parsing when available; it is several times faster than
+# the standard library on large files. Fall back to stdlib json otherwise.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    # orjson documents its JSONDecodeError as a json.JSONDecodeError subclass,
+    # but list both so parse failures are caught regardless of version
+    _JSON_DECODE_ERRORS = (json.JSONDecodeError, orjson.JSONDecodeError)
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+    _JSON_DECODE_ERRORS = (json.JSONDecodeError,)
+
+
+# Sentinel distinguishing "column absent from record" from a stored None
+_MISSING = object()
+
+# Export directory name pattern (table_name_id or table__relationship_id),
+# compiled once at import time and shared by every instance
+_DIR_PATTERN = re.compile(r"([a-z_]+)(__[a-z_]+)?_([0-9]+)")
+
+# Translation table escaping SQL string literals: quote doubling and line
+# break removal in one C-level str.translate pass, instead of a separate
+# search-and-allocate scan per .replace call
+_SQL_ESCAPES = str.maketrans({"'": "''", "\n": " ", "\r": " "})
+
+# Rows packed into one multi-row INSERT statement in .sql output; batching
+# amortizes the SQL parse cost per statement when the file is replayed
+_SQL_BATCH_ROWS = 500
+
+# Reader threads and in-flight window for the serial-path file prefetch
+_READ_AHEAD_WORKERS = 8
+_READ_AHEAD_WINDOW = 16
+
+# Schema introspection queries, hoisted so each is a single shared SQL text.
+# sqlite's prepared-statement cache keys on exact statement text, so reusing
+# one constant guarantees a cache hit if the query is ever issued again on
+# the same connection.
+_SCHEMA_OBJECTS_SQL = (
+    "SELECT type, name, tbl_name, sql FROM sqlite_master "
+    "WHERE type IN ('table', 'index');"
+)
+_SCHEMA_COLUMNS_SQL = (
+    "SELECT m.name, p.* FROM sqlite_master m "
+    "JOIN pragma_table_info(m.name) p "
+    "WHERE m.type = 'table' ORDER BY m.name, p.cid;"
+)
+_SCHEMA_FOREIGN_KEYS_SQL = (
+    "SELECT m.name, f.* FROM sqlite_master m "
+    "JOIN pragma_foreign_key_list(m.name) f "
+    "WHERE m.type = 'table' ORDER BY m.name, f.id, f.seq;"
+)
+
+
+def _format_sql_string(value):
+    """Quote a string as a SQL literal, escaping quotes and removing line breaks"""
+    return "'" + value.translate(_SQL_ESCAPES) + "'"
+
+
+def _format_sql_blob(value):
+    """Format bytes as a SQLite X'...' blob literal; bytes.hex() runs in C"""
+    return f"X'{value.hex()}'"
+
+
+# Formatter per concrete value type. type(value) plus one dict probe replaces
+# the per-cell isinstance ladder; bools and dicts never reach this point
+# because _normalize_value has already coerced them.
+_SQL_FORMATTERS = {
+    type(None): lambda value: "NULL",
+    int: str,
+    float: str,
+    str: _format_sql_string,
+    bytes: _format_sql_blob,
+    bytearray: _format_sql_blob,
+}
+
+
+def _format_sql_value(value, _get=_SQL_FORMATTERS.get):
+    """Format a Python-native value as a SQL literal for .sql file output"""
+    formatter = _get(type(value))
+    if formatter is not None:
+        return formatter(value)
+    # Unregistered types (including str/int subclasses) format via their
+    # string form, matching the previous fallback behavior
+    return _format_sql_string(str(value))
+
+
+def _normalize_value(value):
+    """Coerce a JSON-decoded value into a form sqlite3 can bind directly"""
+    if isinstance(value, bool):
+        return 1 if value else 0
+    if isinstance(value, (dict, list)):
+        # Store dictionaries and arrays as JSON bytes (BLOB)
+        try:
+            return json.dumps(value).encode("utf-8")
+        except Exception:
+            # Fallback to string representation if JSON serialization fails
+            return str(value)
+    if value is None or isinstance(value, (int, float, str, bytes, bytearray)):
+        return value
+    # Anything else would raise sqlite3.InterfaceError from executemany in
+    # direct-load mode; fall back to the string form, matching what the
+    # .sql formatter does for unregistered types
+    return str(value)
+
+
+# Cache of row-formatting functions specialized by column count; each one is
+# generated as source and compiled once at first use
+_row_formatter_cache = {}
+
+
+def _row_formatter(arity):
+    """Return a function that formats a row tuple of the given arity as "(v, v, ...)"
+
+    The function body is generated and compiled at first use, baking the
+    parentheses, the separators and the fixed number of value lookups into
+    straight-line code. That removes the per-row map/join iterator setup from
+    the emit loop, leaving only the per-value formatting calls.
+    """
+    formatter = _row_formatter_cache.get(arity)
+    if formatter is None:
+        values = ", ".join(f"fmt(row[{i}])" for i in range(arity))
+        src = (
+            "def _format_row(row, fmt):\n"
+            f"    return '(' + ', '.join(({values},)) + ')'"
+        )
+        namespace = {}
+        exec(compile(src, "<row formatter>", "exec"), namespace)
+        formatter = namespace["_format_row"]
+        _row_formatter_cache[arity] = formatter
+    return formatter
+
+
+def _row_digest(table_name, columns, row):
+    """Compute a compact 16-byte content digest used to deduplicate rows
+
+    Storing a fixed-size digest instead of the full row tuple keeps the
+    dedup set at 16 bytes per record regardless of row size.
+    """
+    payload = table_name.encode("utf-8") + b"\0" + repr((columns, row)).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+def _json_files(dir_path):
+    """Yield DirEntry objects for the JSON files directly inside a directory
+
+    A single os.scandir pass with a suffix check replaces glob's internal
+    listdir plus fnmatch plus stat chain; is_file reuses the d_type cached
+    from readdir.
+    """
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False):
+                yield entry
+
+
+def _read_file_bytes(file_path):
+    """Read a file's raw bytes; runs on reader threads during prefetch"""
+    with open(file_path, "rb") as f:
+        return f.read()
+
+
+def _prefetch_file_bytes(paths):
+    """Yield (bytes, error) pairs for the given paths in order, reading ahead
+
+    File reads release the GIL, so a small thread pool overlaps the
+    open/read latency of upcoming files with JSON parsing and SQL
+    generation on the main thread. Futures are consumed strictly in
+    submission order with a bounded in-flight window, so output order
+    matches input order and memory stays capped. A failed read yields its
+    exception instead of raising, letting the caller surface it inside the
+    normal per-file error handling.
+    """
+    with ThreadPoolExecutor(max_workers=_READ_AHEAD_WORKERS) as executor:
+        path_iter = iter(paths)
+        pending = deque(
+            executor.submit(_read_file_bytes, file_path)
+            for file_path in islice(path_iter, _READ_AHEAD_WINDOW)
+        )
+        while pending:
+            future = pending.popleft()
+            for file_path in islice(path_iter, 1):
+                pending.append(executor.submit(_read_file_bytes, file_path))
+            try:
+                yield future.result(), None
+            except Exception as exc:
+                yield None, exc
+
+
+def _load_json_file(file_path):
+    """Load a JSON file as bytes and parse with the fastest available parser
+
+    Empty files short-circuit to None — no records — instead of paying for
+    a parse attempt that can only end in a decode error.
+    """
+    # Binary mode skips the Python-level UTF-8 decode; both parsers accept bytes
+    with open(file_path, "rb") as f:
+        raw = f.read()
+    return _json_loads(raw) if raw else None
+
+
+def _parse_worker(file_path):
+    """Read and parse one JSON file in a worker process
+
+    Failures are flagged rather than raised so the main process can re-parse
+    the file and run its normal per-file error handling.
+    """
+    try:
+        return file_path, _load_json_file(file_path), True
+    except Exception:
+        return file_path, None, False
 
 
 class SemaphoreMigration:
+    # Autoincrement tables that keep their exported ids anyway
+    _WHITE_LIST_TABLES = frozenset({"project", "user", "task", "project__template"})
+
     def __init__(self, db_path="database.sqlite", export_dir="export"):
         """Initialize the SemaphoreMigration tool"""
         self.db_path = db_path
@@ -17,12 +238,22 @@ class SemaphoreMigration:
         self.autoincrement_tables = {}
         # Directory name to table name mapping for special cases
         self.directory_table_mapping = {"events": "event"}
-        # Precompile regex pattern for efficiency
-        self.dir_pattern = re.compile(r"([a-z_]+)(__[a-z_]+)?_([0-9]+)")
+        # Precompiled regex pattern shared at module level
+        self.dir_pattern = _DIR_PATTERN
         # ID mapping dictionary to handle ID isolation between projects
         self.id_mappings = {}
+        # Per-table caches of insertable column order and foreign keys by column
+        self._insert_cols_cache = {}
+        self._fk_by_col = {}
+        # Cache of directory path to resolved table name
+        self._actual_table_cache = {}
+        # Flat (from_column, referenced_table, referenced_column) tuples per
+        # table, derived from the schema foreign keys
+        self._fks_by_table = {}
         # Table processing order based on dependencies
         self.processing_order = []
+        # Cache of table dependency sets derived from foreign keys
+        self._dependencies_cache = {}
         # Valid project IDs that exist in the project table
         self.valid_project_ids = set()
 
@@ -63,45 +294,71 @@ class SemaphoreMigration:
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
 
-            # Get all table names
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-            tables = [row[0] for row in cursor.fetchall()]
+            # Tune the connection for this read-only metadata workload:
+            # memory-map the database file and enlarge the page cache so
+            # cold-cache reads skip pager syscalls and copies. Guarded for
+            # older SQLite builds that lack some of these PRAGMAs.
+            try:
+                conn.executescript(
+                    "PRAGMA query_only=1;"
+                    "PRAGMA mmap_size=268435456;"
+                    "PRAGMA cache_size=-16000;"
+                    "PRAGMA temp_store=MEMORY;"
+                )
+            except sqlite3.Error:
+                pass
+
+            # Fetch all table and index definitions in a single sqlite_master
+            # query instead of re-querying per table
+            cursor.execute(_SCHEMA_OBJECTS_SQL)
+            tables = []
+            create_sqls = {}
+            indexes_by_table = defaultdict(list)
+            for obj_type, name, tbl_name, sql in cursor.fetchall():
+                if obj_type == "table":
+                    # Intern table names: they key every schema, mapping and
+                    # cache dict, and interned keys hit CPython's
+                    # identity-compare fast path on lookup
+                    tables.append(sys.intern(name))
+                    create_sqls[name] = sql if sql else ""
+                else:
+                    indexes_by_table[tbl_name].append((name, sql))
+
+            # Fetch column and foreign-key details for every table in two
+            # bulk queries by joining sqlite_master against the pragma
+            # table-valued functions, instead of two round-trips per table
+            cursor.execute(_SCHEMA_COLUMNS_SQL)
+            columns_by_table = defaultdict(list)
+            for row in cursor.fetchall():
+                columns_by_table[row[0]].append(row[1:])
+
+            cursor.execute(_SCHEMA_FOREIGN_KEYS_SQL)
+            fks_by_table = defaultdict(list)
+            for row in cursor.fetchall():
+                fks_by_table[row[0]].append(row[1:])
 
             # Get structure for each table
             for table in tables:
-                # Get table structure
-                cursor.execute(f"PRAGMA table_info({table});")
-                columns = cursor.fetchall()
-
-                # Get table creation statement
-                cursor.execute(
-                    f"SELECT sql FROM sqlite_master WHERE type='table' AND name='{table}';"
-                )
-                create_sql = cursor.fetchone()
-                create_sql = create_sql[0] if create_sql else ""
+                columns = columns_by_table.get(table, [])
+                foreign_keys = fks_by_table.get(table, [])
 
-                # Parse foreign key relationships
-                cursor.execute(f"PRAGMA foreign_key_list({table});")
-                foreign_keys = cursor.fetchall()
-
-                # Parse indexes
-                cursor.execute(
-                    f"SELECT name, sql FROM sqlite_master WHERE type='index' AND tbl_name='{table}';"
-                )
-                indexes = cursor.fetchall()
+                # Look up creation statement and indexes gathered above
+                indexes = indexes_by_table.get(table, [])
 
                 self.schema[table] = {
                     "columns": [],
-                    "create_sql": create_sql,
+                    "create_sql": create_sqls.get(table, ""),
                     "foreign_keys": [],
                     "indexes": [],
                 }
 
                 # Process column information
+                # Intern column names: they probe every record dict and recur
+                # in the grouping keys, so identity comparison pays per row
                 for col in columns:
                     self.schema[table]["columns"].append(
                         {
-                            "name": col[1],
+                            "name": sys.intern(col[1]),
                             "type": col[2],
                             "not_null": bool(col[3]),
                             "default_value": col[4],
@@ -115,8 +372,8 @@ class SemaphoreMigration:
                         {
                             "id": fk[0],
                             "seq": fk[1],
-                            "table": fk[2],
-                            "from": fk[3],
+                            "table": sys.intern(fk[2]),
+                            "from": sys.intern(fk[3]),
                             "to": fk[4],
                             "on_update": fk[5],
                             "on_delete": fk[6],
@@ -142,6 +399,23 @@ class SemaphoreMigration:
                         {"name": idx[0], "sql": idx[1]}
                     )
 
+            # Flatten foreign keys into tuples once so the hot paths iterate
+            # plain tuples instead of re-probing nested schema dicts
+            self._fks_by_table = {
+                table: tuple(
+                    (fk["from"], fk["table"], fk["to"])
+                    for fk in info["foreign_keys"]
+                )
+                for table, info in self.schema.items()
+            }
+
+            # Warm the per-table column and FK caches while the schema is at
+            # hand, so row generation never falls back to the lazy builds
+            self.get_autoincrement_tables()
+            for table in self.schema:
+                self._get_insert_columns(table)
+                self._get_fk_columns(table)
+
             return self.schema
         except sqlite3.Error as e:
             print(f"Database error: {str(e)}")
@@ -171,96 +445,136 @@ class SemaphoreMigration:
                     f"Export directory not found: {self.export_dir}"
                 )
 
-            # Walk through all subdirectories and files in the export directory
-            for root, dirs, files in os.walk(self.export_dir):
-                # Process directories
-                for dir_name in dirs:
+            # Scan the export directory with os.scandir; DirEntry reuses the
+            # stat information from readdir so no extra syscalls are needed
+            self._scan_export_dir()
+            return self.mappings
+        except Exception as e:
+            print(f"Error analyzing export structure: {str(e)}")
+            return self.mappings
+
+    def _scan_export_dir(self):
+        """Scan the export directory with bounded enumeration and collect JSON file mappings
+
+        A bolt2json export only has two meaningful levels: JSON files
+        directly in the export root, and JSON files one level down inside
+        per-bucket directories. Enumerating exactly those two levels replaces
+        the recursive descent, so unrelated nested content never costs a
+        subtree walk.
+        """
+        # Bind the pattern matcher and mapping setdefault as locals; both are
+        # hit once per directory entry
+        match_dir = self.dir_pattern.match
+        mapping_for = self.mappings.setdefault
+
+        subdirs = []
+        with os.scandir(self.export_dir) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
                     # Skip the migrations directory as it gets special handling later
-                    if dir_name == "migrations":
+                    if entry.name == "migrations":
                         continue
+                    subdirs.append(entry)
+                elif entry.name.endswith(".json"):
+                    # Process JSON files directly in the export directory;
+                    # the suffix is already checked, so a slice strips it
+                    # without scanning for the dot. Table names derived from
+                    # the scan are interned so mapping and schema lookups
+                    # compare by identity against the interned schema names.
+                    table_name = sys.intern(entry.name[:-5])
+                    mapping_for(table_name, []).append(
+                        {
+                            "file_path": entry.path,
+                            "file_id": table_name,
+                        }
+                    )
 
-                    dir_path = os.path.join(root, dir_name)
-
-                    # Check if directory matches the standard format (table_name_id or table__relationship_id)
-                    match = self.dir_pattern.match(dir_name)
-                    if match:
-                        base_table = match.group(1)
-                        relationship = match.group(2) if match.group(2) else ""
-                        entity_id = match.group(3)
-
-                        # Build full table name
-                        full_table = base_table + relationship
-
-                        # Initialize list if table not in mappings
-                        self.mappings.setdefault(full_table, [])
-
-                        # Process JSON files in the directory
-                        json_files = glob.glob(os.path.join(dir_path, "*.json"))
-                        for json_file in json_files:
-                            self.mappings[full_table].append(
-                                {
-                                    "file_path": json_file,
-                                    "entity_id": entity_id,
-                                    "file_id": os.path.basename(json_file).split(".")[
-                                        0
-                                    ],
-                                }
-                            )
-                    else:
-                        # Handle directories that don't match the standard format
-                        # Check if directory name has a special mapping to a table name
-                        table_name = self.directory_table_mapping.get(
-                            dir_name, dir_name
-                        )
+        for entry in subdirs:
+            # Check if directory matches the standard format (table_name_id or table__relationship_id)
+            match = match_dir(entry.name)
+            if match:
+                base_table = match.group(1)
+                relationship = match.group(2) if match.group(2) else ""
+                entity_id = match.group(3)
 
-                        # Initialize list if table not in mappings
-                        self.mappings.setdefault(table_name, [])
-
-                        # Process JSON files in the directory
-                        json_files = glob.glob(os.path.join(dir_path, "*.json"))
-                        for json_file in json_files:
-                            self.mappings[table_name].append(
-                                {
-                                    "file_path": json_file,
-                                    "file_id": os.path.basename(json_file).split(".")[
-                                        0
-                                    ],
-                                }
-                            )
+                # Build full table name
+                full_table = sys.intern(base_table + relationship)
 
-                # Process files directly in the export directory
-                for file_name in files:
-                    if file_name.endswith(".json") and root == self.export_dir:
-                        # Process JSON files in the root directory
-                        table_name = file_name.split(".")[0]
-
-                        # Initialize list if table not in mappings
-                        self.mappings.setdefault(table_name, [])
-                        self.mappings[table_name].append(
-                            {
-                                "file_path": os.path.join(root, file_name),
-                                "file_id": table_name,
-                            }
-                        )
-            return self.mappings
-        except Exception as e:
-            print(f"Error analyzing export structure: {str(e)}")
-            return self.mappings
+                # Seed the table-resolution cache so _determine_actual_table
+                # never re-matches a directory the scan already classified
+                self._actual_table_cache[entry.path] = full_table
 
-    def generate_sql_from_json(self, table_name, json_data, project_id=None):
-        """Generate SQL INSERT statements based on table structure and JSON data, handling ID mappings"""
-        sql_statements = []
+                # Initialize list if table not in mappings
+                file_mappings = mapping_for(full_table, [])
+
+                # Process JSON files in the directory
+                for file_entry in _json_files(entry.path):
+                    file_mappings.append(
+                        {
+                            "file_path": file_entry.path,
+                            "entity_id": entity_id,
+                            "file_id": file_entry.name[:-5],
+                        }
+                    )
+            else:
+                # Handle directories that don't match the standard format
+                # Check if directory name has a special mapping to a table name
+                table_name = sys.intern(
+                    self.directory_table_mapping.get(entry.name, entry.name)
+                )
+
+                # Non-matching directories resolve to their mapping default
+                self._actual_table_cache[entry.path] = ""
+
+                # Initialize list if table not in mappings
+                file_mappings = mapping_for(table_name, [])
+
+                # Process JSON files in the directory
+                for file_entry in _json_files(entry.path):
+                    file_mappings.append(
+                        {
+                            "file_path": file_entry.path,
+                            "file_id": file_entry.name[:-5],
+                        }
+                    )
 
+    def generate_rows_for_table(self, table_name, json_data):
+        """Build parameter rows for the given table from JSON data, handling ID mappings
+
+        Returns a list of (columns, rows) groups where columns is a tuple of
+        column names and rows is a list of value tuples holding Python-native
+        values (None, int, float, str, bytes) suitable for sqlite3 parameter
+        binding. Records are grouped by the set of columns they populate so
+        each group can be inserted with a single executemany call.
+        """
         # Validate table exists in schema
         if table_name not in self.schema:
             print(f"Warning: Table {table_name} is not in the schema")
-            return sql_statements
+            return []
+
+        # Per-table column order (with the id column already dropped for
+        # autoincrement tables outside the whitelist) and foreign key map
+        insert_columns = self._get_insert_columns(table_name)
+        # None instead of an empty map lets FK-less tables skip remapping with
+        # a single identity check per column
+        fk_map = self._get_fk_columns(table_name) or None
+
+        # Bind instance attributes used per record as locals; local loads are
+        # considerably cheaper than attribute lookups in the hot loop
+        id_mappings = self.id_mappings
+        valid_project_ids = self.valid_project_ids
+        is_project = table_name == "project"
+        # Only tables whose project_id actually references project need the
+        # existence check; for the rest the whole block is skipped
+        check_project_id = (
+            not is_project
+            and fk_map is not None
+            and fk_map.get("project_id") == "project"
+        )
 
-        table_schema = self.schema[table_name]
-
-        # Get autoincrement tables information
-        if not self.autoincrement_tables:
-            self.get_autoincrement_tables()
+        # Group rows by the tuple of populated columns, preserving order
+        groups = {}
+        group_order = []
 
         # Ensure json_data is in list format
         records = json_data if isinstance(json_data, list) else [json_data]
@@ -272,207 +586,327 @@ class SemaphoreMigration:
 
             # Special check for records that depend on project_id
             # If this record has a project_id and that project doesn't exist, skip it
-            if "project_id" in record and record["project_id"] is not None:
-                if (
-                    table_name != "project"
-                    and record["project_id"] not in self.valid_project_ids
-                ):
+            if check_project_id:
+                project_id = record.get("project_id")
+                if project_id is not None and project_id not in valid_project_ids:
                     print(
-                        f"Skipping record in table {table_name} with non-existent project_id: {record['project_id']}"
+                        f"Skipping record in table {table_name} with non-existent project_id: {project_id}"
                     )
                     continue
 
-            # Check if it's an autoincrement table
-            exclude_id = False
-            white_list_tables = ["project", "user", "task", "project__template"]
-            if (
-                table_name in self.autoincrement_tables
-                and "id" in record
-                and table_name not in white_list_tables
-            ):
-                exclude_id = True
-
-            # Create a copy of the record to modify
-            processed_record = record.copy()
-
-            # Update foreign key references using id_mappings
-            self._update_foreign_keys(processed_record, table_name)
-
             # For project table, track valid project IDs
-            if table_name == "project" and "id" in processed_record:
-                self.valid_project_ids.add(processed_record["id"])
+            if is_project and "id" in record:
+                valid_project_ids.add(record["id"])
 
-            # Filter out columns that exist in the table
+            # Pull the columns present in the record without copying it. The
+            # loop comes in two specialized variants so tables without
+            # foreign keys never test for remapping per column.
             valid_columns = []
             valid_values = []
+            record_get = record.get
+            append_column = valid_columns.append
+            append_value = valid_values.append
+
+            if fk_map is None:
+                for col_name in insert_columns:
+                    value = record_get(col_name, _MISSING)
+                    if value is _MISSING:
+                        continue
+                    append_column(col_name)
+                    append_value(_normalize_value(value))
+            else:
+                for col_name in insert_columns:
+                    value = record_get(col_name, _MISSING)
+                    if value is _MISSING:
+                        continue
 
-            for col in table_schema["columns"]:
-                col_name = col["name"]
-                # Skip id column if it's an autoincrement table and id is 0
-                if exclude_id and col_name == "id":
-                    continue
+                    # Update foreign key references using id_mappings; each
+                    # step is a single dict probe instead of a membership
+                    # test plus a separate item lookup
+                    if value is not None:
+                        ref_table = fk_map.get(col_name)
+                        if ref_table is not None:
+                            mapping = id_mappings.get(ref_table)
+                            if mapping is not None:
+                                value = mapping.get(value, value)
 
-                if col_name in processed_record:
-                    valid_columns.append(col_name)
-                    value = processed_record[col_name]
-
-                    # Process values based on their type
-                    if value is None:
-                        valid_values.append("NULL")
-                    elif isinstance(value, bool):
-                        valid_values.append("1" if value else "0")
-                    elif isinstance(value, (int, float)):
-                        valid_values.append(str(value))
-                    elif isinstance(value, dict):
-                        # Store dictionaries as JSON bytes
-                        try:
-                            json_bytes = json.dumps(value).encode("utf-8")
-                            # For SQLite, use X'hex string' format for BLOBs
-                            hex_str = "".join([f"{byte:02x}" for byte in json_bytes])
-                            valid_values.append(f"X'{hex_str}'")
-                        except Exception as e:
-                            # Fallback to string representation if JSON serialization fails
-                            value_str = str(value).replace("'", "''")
-                            valid_values.append(f"'{value_str}'")
-                    else:
-                        # Handle string values, escape single quotes and remove newlines
-                        value_str = str(value).replace("'", "''").replace("\n", " ")
-                        valid_values.append(f"'{value_str}'")
-
-            # Generate INSERT statement if there are valid columns
+                    append_column(col_name)
+                    append_value(_normalize_value(value))
+
+            # Add the row to its column group if there are valid columns
             if valid_columns:
-                columns_str = ", ".join(valid_columns)
-                values_str = ", ".join(valid_values)
-                sql = f"INSERT INTO {table_name} ({columns_str}) VALUES ({values_str});"
-                sql_statements.append(sql)
-
-        return sql_statements
-
-    def _update_foreign_keys(self, record, table_name):
-        """Update foreign key references in the record using id_mappings"""
-        # Get foreign keys for this table
-        if table_name in self.schema and "foreign_keys" in self.schema[table_name]:
-            for fk in self.schema[table_name]["foreign_keys"]:
-                fk_column = fk["from"]
-                ref_table = fk["table"]
-                ref_column = fk["to"]
-
-                # Check if the record has this foreign key column
-                if fk_column in record and record[fk_column] is not None:
-                    # If we have a mapping for this foreign key, update it
-                    source_id = record[fk_column]
-                    if (
-                        ref_table in self.id_mappings
-                        and source_id in self.id_mappings[ref_table]
-                    ):
-                        record[fk_column] = self.id_mappings[ref_table][source_id]
+                key = tuple(valid_columns)
+                if key not in groups:
+                    groups[key] = []
+                    group_order.append(key)
+                groups[key].append(tuple(valid_values))
+
+        return [(key, groups[key]) for key in group_order]
+
+    def generate_sql_from_json(self, table_name, json_data, project_id=None):
+        """Generate SQL INSERT statements based on table structure and JSON data, handling ID mappings
+
+        Yields one statement per record so callers can stream statements to
+        disk without materializing them all at once.
+        """
+        for columns, rows in self.generate_rows_for_table(table_name, json_data):
+            prefix = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ("
+            format_value = _format_sql_value
+            for row in rows:
+                yield prefix + ", ".join(map(format_value, row)) + ");"
+
+    def _get_insert_columns(self, table_name):
+        """Get the ordered tuple of insertable column names for a table
+
+        For autoincrement tables outside the ID whitelist the id column is
+        dropped up front, so exported ids never reach the generated rows.
+        """
+        cached = self._insert_cols_cache.get(table_name)
+        if cached is not None:
+            return cached
+
+        # Get autoincrement tables information
+        if not self.autoincrement_tables:
+            self.get_autoincrement_tables()
+
+        columns = [col["name"] for col in self.schema[table_name]["columns"]]
+        if (
+            table_name in self.autoincrement_tables
+            and table_name not in self._WHITE_LIST_TABLES
+        ):
+            columns = [name for name in columns if name != "id"]
+
+        columns = tuple(columns)
+        self._insert_cols_cache[table_name] = columns
+        return columns
+
+    def _get_fk_columns(self, table_name):
+        """Get a mapping of foreign key column name to referenced table"""
+        cached = self._fk_by_col.get(table_name)
+        if cached is None:
+            cached = {
+                from_col: ref_table
+                for from_col, ref_table, _ in self._fks_by_table.get(table_name, ())
+            }
+            self._fk_by_col[table_name] = cached
+        return cached
 
     def _determine_processing_order(self, tables_with_data):
-        """Determine the order to process tables based on their dependencies"""
+        """Determine the order to process tables based on their dependencies
+
+        Uses Kahn's topological sort, which runs in O(tables + foreign keys)
+        instead of rescanning every unprocessed table per pass.
+        """
         # Reset processing order
         self.processing_order = []
-        processed = set()
 
-        # Start with tables that have no dependencies or are core tables
-        core_tables = ["user", "project", "option"]
+        # Build in-degree and reverse-dependency maps in one pass
+        indegree = {table: 0 for table in tables_with_data}
+        dependents = defaultdict(list)
+        for table in tables_with_data:
+            for dep in self._get_table_dependencies(table):
+                if dep in indegree and dep != table:
+                    indegree[table] += 1
+                    dependents[dep].append(table)
 
-        # Add core tables first if they have data
+        # Seed the queue with core tables first, then any table without
+        # dependencies among the tables that have data
+        core_tables = ["user", "project", "option"]
+        queue = deque()
+        queued = set()
         for table in core_tables:
-            if table in tables_with_data and table not in processed:
-                self.processing_order.append(table)
-                processed.add(table)
-
-        # Add remaining tables in an order that respects dependencies
-        while len(processed) < len(tables_with_data):
-            added = False
-            for table in tables_with_data:
-                if table not in processed:
-                    # Check if all dependencies are processed
-                    dependencies = self._get_table_dependencies(table)
-                    if all(
-                        dep in processed
-                        for dep in dependencies
-                        if dep in tables_with_data
-                    ):
-                        self.processing_order.append(table)
-                        processed.add(table)
-                        added = True
-            # If no tables could be added, break to avoid infinite loop
-            if not added:
-                break
-
-        # Add any remaining tables that couldn't be ordered
+            if table in indegree:
+                queue.append(table)
+                queued.add(table)
+        for table in tables_with_data:
+            if indegree[table] == 0 and table not in queued:
+                queue.append(table)
+                queued.add(table)
+
+        # Pop tables and release the ones whose dependencies are all processed
+        while queue:
+            table = queue.popleft()
+            self.processing_order.append(table)
+            for dependent in dependents[table]:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0 and dependent not in queued:
+                    queue.append(dependent)
+                    queued.add(dependent)
+
+        # Add any remaining tables that couldn't be ordered (dependency cycles)
         for table in tables_with_data:
-            if table not in processed:
+            if table not in queued:
                 self.processing_order.append(table)
-                processed.add(table)
+                queued.add(table)
 
         return self.processing_order
 
     def _get_table_dependencies(self, table_name):
         """Get all tables that this table depends on through foreign keys"""
-        dependencies = set()
-        if table_name in self.schema and "foreign_keys" in self.schema[table_name]:
-            for fk in self.schema[table_name]["foreign_keys"]:
-                dependencies.add(fk["table"])
+        cached = self._dependencies_cache.get(table_name)
+        if cached is not None:
+            return cached
+
+        dependencies = {
+            ref_table
+            for _, ref_table, _ in self._fks_by_table.get(table_name, ())
+        }
+        self._dependencies_cache[table_name] = dependencies
         return dependencies
 
-    def process_all_data(self, output_file="migrated_data.sql"):
-        """Process all exported data and generate complete SQL statements with proper ID mapping"""
+    def _build_work_list(self):
+        """Flatten the analyzed mappings into an ordered (table, file path) list
+
+        Resolves each file to its actual table once and drops unknown and
+        session tables up front, so the write loop never re-runs the
+        membership checks per file. Files for the same table stay contiguous,
+        which lets the writer group them with a plain run-length pass.
+        """
+        work = []
+        append = work.append
+        schema = self.schema
+        mappings = self.mappings
+        determine = self._determine_actual_table
+        for table_name in self.processing_order:
+            for file_info in mappings.get(table_name, ()):
+                file_path = file_info["file_path"]
+                actual_table = determine(file_path, table_name)
+                if actual_table in schema and actual_table != "session":
+                    append((actual_table, file_path))
+        return work
+
+    def _open_write_connection(self):
+        """Open a write connection to the target database tuned for bulk loading"""
+        conn = sqlite3.connect(self.db_path)
+        # Manage transactions explicitly so the whole load runs in one BEGIN/COMMIT
+        conn.isolation_level = None
+        cursor = conn.cursor()
+        # WAL + relaxed fsync turns the per-statement autocommit cost into a
+        # single commit at the end of the load
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-200000")
+        return conn, cursor
+
+    def process_all_data(
+        self, output_file="migrated_data.sql", direct_load=False, parallel_workers=None
+    ):
+        """Process all exported data and generate complete SQL statements with proper ID mapping
+
+        With direct_load=True the rows are inserted straight into the target
+        database via parameterized executemany inside a single transaction
+        instead of being written to a .sql file.
+
+        With parallel_workers set, JSON files are read and parsed up front by
+        a pool of worker processes; the dependency-ordered insert stage still
+        runs on the main process so ID mappings stay deterministic. This
+        trades memory (all decoded data is held at once) for parse speed.
+        """
+        write_conn = None
+        write_cursor = None
+        out = None
+        byte_stream = None
         try:
             # Get schema and analyze export structure
             self.get_schema_json()
             self.analyze_export_structure()
 
+            # Open the target database connection when loading directly,
+            # otherwise stream statements through a large write buffer so the
+            # full SQL output never has to sit in memory
+            if direct_load:
+                write_conn, write_cursor = self._open_write_connection()
+            else:
+                out = open(
+                    output_file,
+                    "w",
+                    encoding="utf-8",
+                    newline="\n",
+                    buffering=16 * 1024 * 1024,
+                )
+
             # Initialize variables for SQL generation
-            all_sql_statements = []
-            processed_tables = set()
             table_file_counts = {}
             tables_with_data = set()
 
-            # First pass: collect all tables that have data to process
+            # Collect the tables that have data straight from the analyzed
+            # mappings; analyze_export_structure already resolved each
+            # directory to its table, so no second walk over the files is
+            # needed just to learn the table set
             for table_name, file_mappings in self.mappings.items():
                 # Skip migrations and session tables
                 if table_name == "migrations" or table_name == "session":
                     continue
 
-                for file_info in file_mappings:
-                    file_path = file_info["file_path"]
-                    try:
-                        actual_table = self._determine_actual_table(
-                            file_path, table_name
-                        )
-                        if actual_table in self.schema and actual_table != "session":
-                            tables_with_data.add(actual_table)
-                    except Exception:
-                        # Just skip if there's any error in determining actual table
-                        pass
+                if file_mappings and table_name in self.schema:
+                    tables_with_data.add(table_name)
 
             # Add DELETE statements for all tables with data and reset autoincrement
             if tables_with_data:
-                all_sql_statements.append(
-                    "-- Clear existing data from tables before migration"
-                )
-                all_sql_statements.append(
-                    "-- Reset autoincrement sequences to start from 0"
-                )
-
-                # First delete all data from tables
-                for table in sorted(tables_with_data):
-                    all_sql_statements.append(f"DELETE FROM {table};")
-
-                # Then reset the autoincrement counter for each table
-                # This will reset the ID sequence to start from 0
-                all_sql_statements.append("")
-                all_sql_statements.append("-- Reset autoincrement sequences")
-                for table in sorted(tables_with_data):
-                    all_sql_statements.append(
-                        f"DELETE FROM sqlite_sequence WHERE name='{table}';"
-                    )
-                all_sql_statements.append("")
-
-            # Determine processing order based on table dependencies
+                if direct_load:
+                    # Run the whole load in one transaction
+                    write_cursor.execute("BEGIN")
+                    for table in sorted(tables_with_data):
+                        write_cursor.execute(f"DELETE FROM {table};")
+                    for table in sorted(tables_with_data):
+                        write_cursor.execute(
+                            "DELETE FROM sqlite_sequence WHERE name=?", (table,)
+                        )
+                else:
+                    out.write("-- Clear existing data from tables before migration\n")
+                    out.write("-- Reset autoincrement sequences to start from 0\n")
+
+                    # First delete all data from tables
+                    for table in sorted(tables_with_data):
+                        out.write(f"DELETE FROM {table};\n")
+
+                    # Then reset the autoincrement counter for each table
+                    # This will reset the ID sequence to start from 0
+                    out.write("\n")
+                    out.write("-- Reset autoincrement sequences\n")
+                    for table in sorted(tables_with_data):
+                        out.write(f"DELETE FROM sqlite_sequence WHERE name='{table}';\n")
+                    out.write("\n")
+
+            # Determine processing order based on table dependencies, then
+            # flatten the mappings into the ordered per-file work list
             self._determine_processing_order(tables_with_data)
+            work_list = self._build_work_list()
+
+            # Optionally parse all JSON files up front with a process pool;
+            # parsing is CPU-bound and independent per file. Row generation
+            # stays on the main process because ID remapping and the project
+            # existence filter depend on the rows already processed.
+            parsed_data = None
+            if parallel_workers:
+                if parallel_workers is True:
+                    parallel_workers = os.cpu_count() or 1
+                paths = [file_path for _, file_path in work_list]
+                # Only fan out when there is enough work to amortize pool startup
+                if len(paths) > 1 and parallel_workers > 1:
+                    parsed_data = {}
+                    try:
+                        with ProcessPoolExecutor(
+                            max_workers=parallel_workers
+                        ) as executor:
+                            for file_path, data, ok in executor.map(
+                                _parse_worker, paths, chunksize=32
+                            ):
+                                if ok:
+                                    parsed_data[file_path] = data
+                    except OSError:
+                        # Process pools can be unavailable in restricted
+                        # environments; fall back to serial parsing
+                        parsed_data = None
+
+            # When no up-front parse pool is in use, prefetch file bytes on
+            # reader threads so disk latency on upcoming files overlaps the
+            # parse and SQL generation work on the main thread
+            if parsed_data is None and work_list:
+                byte_stream = _prefetch_file_bytes(
+                    file_path for _, file_path in work_list
+                )
 
             # Initialize ID mappings for each table
             for table in tables_with_data:
@@ -487,36 +921,32 @@ class SemaphoreMigration:
             # Special handling for event table: collect all events first, then sort by created
             event_records = []
 
-            for table_name in self.processing_order:
-                # Skip if table is not in mappings
-                if table_name not in self.mappings:
-                    continue
-
-                file_mappings = self.mappings[table_name]
-
-                # Add table comment only once
-                if table_name not in processed_tables and table_name != "event":
-                    all_sql_statements.append(
-                        f"-- SQL statements for table: {table_name}"
-                    )
-                    processed_tables.add(table_name)
+            # The work list keeps each table's files contiguous, so a plain
+            # run-length grouping replaces the per-table processed set and the
+            # per-file table resolution and schema checks
+            for actual_table, group in groupby(work_list, key=itemgetter(0)):
+                # Add table comment once per table
+                if not direct_load and actual_table != "event":
+                    out.write(f"-- SQL statements for table: {actual_table}\n")
 
-                # Process each file mapping
-                for file_info in file_mappings:
-                    file_path = file_info["file_path"]
+                # Process each file in the group
+                for _, file_path in group:
                     try:
-                        # Determine actual table name from directory structure
-                        actual_table = self._determine_actual_table(
-                            file_path, table_name
-                        )
-
-                        # Skip if table doesn't exist in schema or is session table
-                        if actual_table not in self.schema or actual_table == "session":
-                            continue
-
-                        # Safely load JSON data
-                        with open(file_path, "r", encoding="utf-8") as f:
-                            data = json.load(f)
+                        # Safely load JSON data, preferring the prefetched
+                        # parse; files whose workers failed are re-parsed here
+                        # so the error handling below applies
+                        if parsed_data is not None:
+                            data = parsed_data.pop(file_path, _MISSING)
+                            if data is _MISSING:
+                                data = _load_json_file(file_path)
+                        else:
+                            # The byte stream runs in work-list order, so the
+                            # next item is always this file's read
+                            raw, read_error = next(byte_stream)
+                            if read_error is not None:
+                                raise read_error
+                            # Empty files carry no records; skip the parse
+                            data = _json_loads(raw) if raw else None
 
                         # Update file count for this table
                         table_file_counts[actual_table] = (
@@ -533,21 +963,19 @@ class SemaphoreMigration:
                                     event_records.append(record.copy())
                         else:
                             # For other tables, process normally
-                            # Generate and add SQL statements with deduplication
-                            sql_statements = self.generate_sql_from_json(
-                                actual_table, data, file_info.get("entity_id")
+                            # Generate rows and emit them with deduplication
+                            row_groups = self.generate_rows_for_table(
+                                actual_table, data
+                            )
+                            self._emit_rows(
+                                actual_table,
+                                row_groups,
+                                processed_records,
+                                out,
+                                write_cursor,
                             )
 
-                            # Deduplicate SQL statements
-                            for sql in sql_statements:
-                                # Create a unique key for each record based on table and values
-                                # This helps identify and skip duplicate records
-                                record_key = f"{actual_table}:{sql}"
-                                if record_key not in processed_records:
-                                    all_sql_statements.append(sql)
-                                    processed_records.add(record_key)
-
-                    except json.JSONDecodeError:
+                    except _JSON_DECODE_ERRORS:
                         print(f"Error: Invalid JSON format in file {file_path}")
                     except FileNotFoundError:
                         print(f"Error: File not found - {file_path}")
@@ -556,28 +984,36 @@ class SemaphoreMigration:
 
             # Now process event table with sorted records
             if event_records:
-                # Add comment for event table
-                all_sql_statements.append("")
-                all_sql_statements.append(
-                    "-- SQL statements for table: event (sorted by created)"
+                if not direct_load:
+                    # Add comment for event table
+                    out.write("\n")
+                    out.write("-- SQL statements for table: event (sorted by created)\n")
+
+                # Sort event records by 'created' field. The records are
+                # already copies, so default the key once and use the C-level
+                # itemgetter instead of a lambda with .get per element
+                for record in event_records:
+                    record.setdefault("created", "")
+                event_records.sort(key=itemgetter("created"))
+
+                # Generate rows for sorted event records and emit with deduplication
+                row_groups = self.generate_rows_for_table("event", event_records)
+                self._emit_rows(
+                    "event",
+                    row_groups,
+                    processed_records,
+                    out,
+                    write_cursor,
                 )
 
-                # Sort event records by 'created' field
-                event_records.sort(key=lambda x: x.get("created", ""))
-
-                # Generate SQL statements for sorted event records
-                sql_statements = self.generate_sql_from_json("event", event_records)
-
-                # Deduplicate and add to all_sql_statements
-                for sql in sql_statements:
-                    record_key = f"event:{sql}"
-                    if record_key not in processed_records:
-                        all_sql_statements.append(sql)
-                        processed_records.add(record_key)
-
-            # Write all SQL statements to output file
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write("\n".join(all_sql_statements))
+            if direct_load:
+                # Commit the single transaction covering the whole load
+                if tables_with_data:
+                    write_cursor.execute("COMMIT")
+                self._print_processing_summary(
+                    table_file_counts, self.db_path, direct_load=True
+                )
+                return self.db_path
 
             # Print processing summary
             self._print_processing_summary(table_file_counts, output_file)
@@ -586,25 +1022,98 @@ class SemaphoreMigration:
         except Exception as e:
             print(f"Fatal error during data processing: {str(e)}")
             raise
+        finally:
+            # Shut down the reader pool and close the output file and write
+            # connection if opened
+            if byte_stream is not None:
+                byte_stream.close()
+            if out:
+                out.close()
+            if write_cursor:
+                try:
+                    write_cursor.close()
+                except sqlite3.Error:
+                    pass
+            if write_conn:
+                try:
+                    write_conn.close()
+                except sqlite3.Error:
+                    pass
+
+    def _emit_rows(
+        self,
+        table_name,
+        row_groups,
+        processed_records,
+        out=None,
+        write_cursor=None,
+    ):
+        """Emit row groups either directly via executemany or as SQL text, with deduplication"""
+        for columns, rows in row_groups:
+            # Deduplicate rows across files based on a digest of table and values
+            new_rows = []
+            for row in rows:
+                record_key = _row_digest(table_name, columns, row)
+                if record_key not in processed_records:
+                    new_rows.append(row)
+                    processed_records.add(record_key)
+
+            if not new_rows:
+                continue
+
+            if write_cursor is not None:
+                placeholders = ", ".join("?" * len(columns))
+                columns_str = ", ".join(columns)
+                write_cursor.executemany(
+                    f"INSERT INTO {table_name} ({columns_str}) VALUES ({placeholders})",
+                    new_rows,
+                )
+            else:
+                # Rows in a group share a column set, so the statement prefix
+                # is built once per group and rows are packed into multi-row
+                # VALUES batches
+                prefix = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES "
+                format_value = _format_sql_value
+                format_row = _row_formatter(len(columns))
+                write = out.write
+                for start in range(0, len(new_rows), _SQL_BATCH_ROWS):
+                    batch = new_rows[start : start + _SQL_BATCH_ROWS]
+                    # Preformat each row, then emit the statement in three
+                    # writes so no statement-sized string is concatenated
+                    row_parts = [format_row(row, format_value) for row in batch]
+                    write(prefix)
+                    write(", ".join(row_parts))
+                    write(";\n")
 
     def _determine_actual_table(self, file_path, default_table):
         """Determine the actual table name based on directory structure"""
-        # Check if file is in a directory with pattern like table_name__relationship_id
-        match = re.match(
-            r"([a-z_]+)(__[a-z_]+)?_([0-9]+)",
-            os.path.basename(os.path.dirname(file_path)),
-        )
-        if match:
-            return match.group(1) + (match.group(2) if match.group(2) else "")
-        return default_table
+        # All files in a directory resolve to the same table, so cache the
+        # regex result per parent directory
+        parent = os.path.dirname(file_path)
+        cached = self._actual_table_cache.get(parent)
+        if cached is None:
+            # Check if the directory matches the pattern table_name__relationship_id
+            match = self.dir_pattern.match(os.path.basename(parent))
+            if match:
+                cached = sys.intern(
+                    match.group(1) + (match.group(2) if match.group(2) else "")
+                )
+            else:
+                # Empty string marks directories that don't match the pattern
+                cached = ""
+            self._actual_table_cache[parent] = cached
+        return cached or default_table
 
-    def _print_processing_summary(self, table_file_counts, output_file):
+    def _print_processing_summary(self, table_file_counts, output_file, direct_load=False):
         """Print summary of files processed and output file information"""
         print("\nFiles processed per table:")
         for table, count in sorted(table_file_counts.items()):
             print(f"{table}: {count} files")
 
-        print(f"\nSQL statements have been generated to {output_file}")
+        if direct_load:
+            print(f"\nData has been loaded directly into {output_file}")
+        else:
+            print(f"\nSQL statements have been generated to {output_file}")
 
     def get_relationships_summary(self):
         """Get database table relationships summary"""
@@ -685,7 +1194,7 @@ if __name__ == "__main__":
     except FileNotFoundError as e:
         print("\n❌ Error: Required file not found!")
         print(f"Details: {str(e)}")
-    except json.JSONDecodeError:
+    except _JSON_DECODE_ERRORS:
         print("\n❌ Error: Invalid JSON format in one of the export files!")
     except sqlite3.Error as e:
         print("\n❌ Error: Database access error!")